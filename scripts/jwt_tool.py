@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+JWT test tool - generates and validates tokens for microservices authentication
+Shared implementation behind scripts/test-jwt.py and scripts/test-jwt-full.py
+"""
+
+import binascii
+import hashlib
+import hmac
+import os
+import sys
+import time
+
+# jwt (which pulls in cryptography), json, datetime, subprocess and
+# concurrent.futures are imported where they are used, so the usage and
+# error paths exit without paying for them
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    # datetimes are encoded natively (naive ones as UTC, with a Z suffix)
+    # rather than through a Python default= callback per field
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def _json_dumps(obj):
+        """Pretty-print obj as JSON"""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # Only types orjson cannot encode at all fall back to str()
+            return orjson.dumps(obj, default=str, option=_ORJSON_DUMPS_OPTIONS).decode()
+else:
+    import json
+
+    def _json_loads(data):
+        """Parse a JSON document from bytes"""
+        # Hand json.loads a str: given bytes it first runs its pure-Python
+        # encoding sniffer, which costs more than the UTF-8 decode itself
+        return json.loads(data.decode())
+
+    def _json_dumps(obj):
+        """Pretty-print obj as JSON"""
+        return json.dumps(obj, indent=2, default=str)
+
+# Configuration - must match Next.js app
+JWT_SECRET = os.getenv('JWT_SECRET', 'your-jwt-secret-key-min-32-characters-long')
+JWT_ISSUER = os.getenv('JWT_ISSUER', 'saas-scaffolding')
+JWT_AUDIENCE = os.getenv('JWT_AUDIENCE', 'microservices')
+
+# Encoded once; the HMAC pads and PyJWT's encode/decode all take these bytes
+_JWT_SECRET_BYTES = JWT_SECRET.encode('utf-8')
+
+# HMAC-SHA256 with the inner/outer pads absorbed up front; each token only
+# copies these states instead of re-deriving the pads from the secret
+_HMAC_BLOCK_SIZE = 64
+_key_block = _JWT_SECRET_BYTES
+if len(_key_block) > _HMAC_BLOCK_SIZE:
+    _key_block = hashlib.sha256(_key_block).digest()
+# XOR the whole block as one integer instead of looping over its bytes
+_key_int = int.from_bytes(_key_block.ljust(_HMAC_BLOCK_SIZE, b'\0'), 'big')
+_IPAD = int.from_bytes(b'\x36' * _HMAC_BLOCK_SIZE, 'big')
+_OPAD = int.from_bytes(b'\x5c' * _HMAC_BLOCK_SIZE, 'big')
+_HMAC_INNER = hashlib.sha256((_key_int ^ _IPAD).to_bytes(_HMAC_BLOCK_SIZE, 'big'))
+_HMAC_OUTER = hashlib.sha256((_key_int ^ _OPAD).to_bytes(_HMAC_BLOCK_SIZE, 'big'))
+del _key_block, _key_int
+
+def _sysctl(name):
+    """Read a sysctl value on macOS, or '' if the key does not exist"""
+    import subprocess
+
+    result = subprocess.run(['sysctl', '-n', name], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else ''
+
+def _cpu_has_sha_ni():
+    """Check whether the CPU advertises hardware SHA-256 instructions"""
+    if sys.platform == 'darwin':
+        return ('SHA' in _sysctl('machdep.cpu.leaf7_features').split()
+                or _sysctl('hw.optional.arm.FEAT_SHA256') == '1')
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            flags = cpuinfo.read().split()
+    except OSError:
+        return False
+    # x86 reports sha_ni, ARMv8 reports sha2
+    return 'sha_ni' in flags or 'sha2' in flags
+
+def _hmac_backend():
+    """Describe which SHA-256 implementation HMAC will run on"""
+    if 'sha256' not in hashlib.algorithms_available:
+        return 'unavailable'
+    if hashlib.sha256.__name__ != 'openssl_sha256':
+        return 'builtin sha256'
+    return f"OpenSSL EVP (SHA-NI: {'yes' if _cpu_has_sha_ni() else 'no'})"
+
+def generate_test_token():
+    """Generate a test token for validation"""
+    now = int(time.time())
+    payload = {
+        'userId': 'test-user-id-123',
+        'email': 'test@example.com',
+        'organizationId': 'test-org-id-456',
+        'organizationSlug': 'test-org',
+        'role': 'owner',
+        'permissions': [
+            {'resource': 'organization', 'action': 'read'},
+            {'resource': 'organization', 'action': 'update'},
+            {'resource': 'users', 'action': 'read'},
+            {'resource': 'users', 'action': 'create'},
+        ],
+        'iss': JWT_ISSUER,
+        'aud': JWT_AUDIENCE,
+        'iat': now,
+        'exp': now + 3600,
+    }
+    
+    import jwt
+
+    token = jwt.encode(payload, _JWT_SECRET_BYTES, algorithm='HS256')
+    return token
+
+# base64url -> standard alphabet, and the padding each length remainder needs
+_URLSAFE_TABLE = bytes.maketrans(b'-_', b'+/')
+_PAD = (b'', b'===', b'==', b'=')
+
+def _b64url_decode(segment):
+    """Decode an unpadded base64url JWT segment"""
+    return binascii.a2b_base64(segment.translate(_URLSAFE_TABLE) + _PAD[len(segment) & 3])
+
+def _hmac_sha256(message):
+    """HMAC-SHA256 of message under JWT_SECRET, using the precomputed pad states"""
+    inner = _HMAC_INNER.copy()
+    inner.update(message)
+    outer = _HMAC_OUTER.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+def _verify_hashlib(token):
+    """Verify an HS256 token and its claims, raising the same errors as jwt.decode"""
+    # PyJWT is imported inside each failure branch, so a token that passes
+    # every check never executes an import statement
+    try:
+        data = token.encode('ascii')
+    except UnicodeEncodeError:
+        import jwt
+        raise jwt.DecodeError('Invalid token encoding')
+
+    # Reject malformed tokens and foreign headers before doing any HMAC work
+    signing_input, _, signature = data.rpartition(b'.')
+    header_segment, _, payload_segment = signing_input.partition(b'.')
+    if data.count(b'.') != 2:
+        import jwt
+        raise jwt.DecodeError('Token must have three segments')
+    try:
+        header = _json_loads(_b64url_decode(header_segment))
+    except (binascii.Error, ValueError):
+        import jwt
+        raise jwt.DecodeError('Invalid header encoding')
+    if not isinstance(header, dict):
+        import jwt
+        raise jwt.DecodeError('Invalid header string: must be a json object')
+    if header.get('alg') != 'HS256':
+        import jwt
+        raise jwt.InvalidAlgorithmError('The specified alg value is not allowed')
+    if header.get('typ', 'JWT') != 'JWT':
+        import jwt
+        raise jwt.InvalidTokenError('Invalid token type')
+
+    try:
+        signature = _b64url_decode(signature)
+    except binascii.Error:
+        import jwt
+        raise jwt.DecodeError('Invalid crypto padding')
+    # An empty signature can never match, so skip the HMAC for it
+    if not signature or not hmac.compare_digest(_hmac_sha256(signing_input), signature):
+        import jwt
+        raise jwt.InvalidSignatureError('Signature verification failed')
+
+    try:
+        payload = _json_loads(_b64url_decode(payload_segment))
+    except (binascii.Error, ValueError):
+        import jwt
+        raise jwt.DecodeError('Invalid payload encoding')
+    if not isinstance(payload, dict):
+        import jwt
+        raise jwt.DecodeError('Invalid payload string: must be a json object')
+
+    # Integer compare against the clock; datetimes are only built for display
+    # Checked in the same order as jwt.decode: iat, nbf, exp
+    now = int(time.time())
+    if 'iat' in payload:
+        try:
+            iat = int(payload['iat'])
+        except (TypeError, ValueError):
+            import jwt
+            raise jwt.InvalidIssuedAtError('Issued At claim (iat) must be an integer.')
+        if iat > now:
+            import jwt
+            raise jwt.ImmatureSignatureError('The token is not yet valid (iat)')
+    if 'nbf' in payload:
+        try:
+            nbf = int(payload['nbf'])
+        except (TypeError, ValueError):
+            import jwt
+            raise jwt.DecodeError('Not Before claim (nbf) must be an integer.')
+        if nbf > now:
+            import jwt
+            raise jwt.ImmatureSignatureError('The token is not yet valid (nbf)')
+    if 'exp' in payload:
+        try:
+            exp = int(payload['exp'])
+        except (TypeError, ValueError):
+            import jwt
+            raise jwt.DecodeError('Expiration Time claim (exp) must be an integer.')
+        if exp <= now:
+            import jwt
+            raise jwt.ExpiredSignatureError('Signature has expired')
+
+    # One lookup and compare per claim on the success path; work out which
+    # error applies only once the check has already failed
+    issuer = payload.get('iss')
+    if issuer != JWT_ISSUER:
+        import jwt
+        if 'iss' not in payload:
+            raise jwt.MissingRequiredClaimError('iss')
+        raise jwt.InvalidIssuerError('Invalid issuer')
+
+    audience = payload.get('aud')
+    if audience != JWT_AUDIENCE:
+        import jwt
+        if not audience:
+            raise jwt.MissingRequiredClaimError('aud')
+        if isinstance(audience, list) and all(isinstance(claim, str) for claim in audience):
+            if JWT_AUDIENCE not in audience:
+                raise jwt.InvalidAudienceError("Audience doesn't match")
+        elif isinstance(audience, str):
+            raise jwt.InvalidAudienceError("Audience doesn't match")
+        else:
+            raise jwt.InvalidAudienceError('Invalid claim format in token')
+
+    return payload
+
+def _verify_pyjwt(token):
+    """Reference verifier: PyJWT's own decode, for comparison"""
+    import jwt
+
+    return jwt.decode(
+        token,
+        _JWT_SECRET_BYTES,
+        algorithms=['HS256'],
+        issuer=JWT_ISSUER,
+        audience=JWT_AUDIENCE
+    )
+
+_VERIFIERS = {
+    'hashlib': _verify_hashlib,
+    'pyjwt': _verify_pyjwt,
+}
+
+def _select_verifier(backend):
+    """Bind the named verifier to _verify so validation never branches on it
+
+    Nothing is auto-detected: 'hashlib' is the default and 'pyjwt' is only
+    there as a reference to compare against (JWT_VERIFY_BACKEND in the CLI).
+    """
+    global _VERIFY_BACKEND, _verify
+    if backend not in _VERIFIERS:
+        raise ValueError(f"Unknown JWT_VERIFY_BACKEND: {backend} (expected one of: {', '.join(_VERIFIERS)})")
+    _VERIFY_BACKEND, _verify = backend, _VERIFIERS[backend]
+
+_select_verifier('hashlib')
+
+def validate_token(token):
+    """Validate JWT token and return payload"""
+    try:
+        return _verify(token)
+    except Exception as e:
+        # PyJWT is only imported once validation has actually failed
+        import jwt
+
+        if isinstance(e, jwt.ExpiredSignatureError):
+            print("❌ Token expired")
+        elif isinstance(e, jwt.InvalidIssuerError):
+            print(f"❌ Invalid issuer. Expected: {JWT_ISSUER}")
+        elif isinstance(e, jwt.InvalidAudienceError):
+            print(f"❌ Invalid audience. Expected: {JWT_AUDIENCE}")
+        elif isinstance(e, jwt.InvalidTokenError):
+            print(f"❌ Invalid token: {str(e)}")
+        else:
+            raise
+        return None
+
+def _is_valid(token):
+    """Batch worker: verify a token without printing the failure reason"""
+    try:
+        _verify(token)
+    except Exception as e:
+        import jwt
+
+        if not isinstance(e, jwt.InvalidTokenError):
+            raise
+        return False
+    return True
+
+def validate_batch(tokens):
+    """Validate tokens across all cores and return (valid count, elapsed seconds)"""
+    # Processes rather than threads: hashlib only releases the GIL for inputs
+    # of 2 KiB or more, and tokens are far smaller than that
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    # Workers re-import this module under the spawn start method, so hand
+    # them the selected backend rather than relying on the import default
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_select_verifier,
+                             initargs=(_VERIFY_BACKEND,)) as executor:
+        valid = sum(executor.map(_is_valid, tokens, chunksize=256))
+    return valid, time.perf_counter() - start
+
+def benchmark(token, iterations):
+    """Time _verify on one token and return the mean nanoseconds per call"""
+    # Warm up caches and the allocator before the timed window
+    for _ in range(min(iterations, 1000)):
+        _verify(token)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        _verify(token)
+    return (time.perf_counter_ns() - start) / iterations
+
+def _print_configuration():
+    """Print the settings the token is checked against"""
+    print("Configuration:")
+    print(f"  JWT_SECRET: {'*' * 20}...{JWT_SECRET[-8:] if len(JWT_SECRET) > 8 else '***'}")
+    print(f"  JWT_ISSUER: {JWT_ISSUER}")
+    print(f"  JWT_AUDIENCE: {JWT_AUDIENCE}")
+    print(f"  HMAC-SHA256: {_hmac_backend()}")
+    print(f"  Verifier: {_VERIFY_BACKEND}")
+    print()
+
+def _validate_and_report(token, width):
+    """Validate a provided token and print its claims, exiting 1 if invalid"""
+    from datetime import datetime, timezone
+
+    _print_configuration()
+    print("Validating token...")
+    print("-" * width)
+    
+    payload = validate_token(token)
+    
+    if payload:
+        print("✅ Token is valid!")
+        print()
+        print("Token Payload:")
+        print("-" * width)
+        print(_json_dumps(payload))
+        print()
+        print("Extracted Information:")
+        print("-" * width)
+        print(f"  User ID: {payload.get('userId')}")
+        print(f"  Email: {payload.get('email')}")
+        print(f"  Organization ID: {payload.get('organizationId')}")
+        print(f"  Organization Slug: {payload.get('organizationSlug')}")
+        print(f"  Role: {payload.get('role')}")
+        print(f"  Permissions: {len(payload.get('permissions', []))} permissions")
+        print()
+        
+        # Show permissions
+        if payload.get('permissions'):
+            print("Permissions:")
+            for perm in payload['permissions']:
+                print(f"  - {perm.get('resource')}.{perm.get('action')}")
+            print()
+        
+        # Show expiration
+        exp = payload.get('exp')
+        if exp:
+            exp_date = datetime.fromtimestamp(exp, tz=timezone.utc)
+            remaining = exp_date - datetime.now(tz=timezone.utc)
+            print(f"  Expires: {exp_date.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+            print(f"  Time remaining: {remaining}")
+            print()
+        
+        print("=" * width)
+        print("✅ Hello World - JWT validation working correctly!")
+        print("=" * width)
+    else:
+        print("=" * width)
+        print("❌ Token validation failed")
+        print("=" * width)
+        sys.exit(1)
+
+def _main_simple():
+    print("=" * 60)
+    print("JWT Validation Test - Hello World")
+    print("=" * 60)
+    print()
+    
+    # Check if JWT_SECRET is set
+    if JWT_SECRET == 'your-jwt-secret-key-min-32-characters-long':
+        print("⚠️  WARNING: JWT_SECRET not configured!")
+        print("   Set JWT_SECRET environment variable before testing")
+        print()
+        print("   Example:")
+        print("   export JWT_SECRET='your-actual-secret-key'")
+        print("   python scripts/test-jwt.py <token>")
+        print()
+        sys.exit(1)
+    
+    # Get token from command line argument
+    if len(sys.argv) < 2:
+        print("Usage: python scripts/test-jwt.py <jwt_token>")
+        print()
+        print("Example:")
+        print("  python scripts/test-jwt.py 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...'")
+        print()
+        print("To get a token, make a POST request to /api/microservices/token")
+        print("from an authenticated session in the Next.js app.")
+        sys.exit(1)
+    
+    _validate_and_report(sys.argv[1], 60)
+
+def _main_full():
+    print("=" * 70)
+    print("JWT Validation Test - Complete Flow")
+    print("=" * 70)
+    print()
+    
+    # Check if JWT_SECRET is set
+    if JWT_SECRET == 'your-jwt-secret-key-min-32-characters-long':
+        print("⚠️  WARNING: JWT_SECRET not configured!")
+        print("   Set JWT_SECRET environment variable to test with real tokens")
+        print()
+        print("   For this test, using default secret (will only work with test tokens)")
+        print()
+    
+    # Check command line arguments
+    if len(sys.argv) > 1 and sys.argv[1] == '--generate':
+        # Generate and validate test token
+        print("Generating test token...")
+        print("-" * 70)
+        token = generate_test_token()
+        print(f"✅ Test token generated: {token[:50]}...")
+        print()
+        print("Validating test token...")
+        print("-" * 70)
+        payload = validate_token(token)
+        
+        if payload:
+            print("✅ Token validation successful!")
+            print()
+            print("Token Payload:")
+            print(_json_dumps(payload))
+            print()
+            print("=" * 70)
+            print("✅ Hello World - JWT generation and validation working!")
+            print("=" * 70)
+        else:
+            print("❌ Token validation failed")
+            sys.exit(1)
+    elif len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        # Validate one token per line from a file
+        if len(sys.argv) < 3:
+            print("Usage: python scripts/test-jwt-full.py --batch <file>")
+            sys.exit(1)
+        
+        try:
+            with open(sys.argv[2]) as f:
+                tokens = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"❌ Cannot read token file: {e}")
+            print("Usage: python scripts/test-jwt-full.py --batch <file>")
+            sys.exit(1)
+        if not tokens:
+            print(f"❌ No tokens found in {sys.argv[2]} (expected one token per line)")
+            sys.exit(1)
+        
+        print(f"Validating {len(tokens)} tokens from {sys.argv[2]}...")
+        print("-" * 70)
+        valid, elapsed = validate_batch(tokens)
+        print(f"  Valid: {valid}")
+        print(f"  Invalid: {len(tokens) - valid}")
+        print(f"  Workers: {os.cpu_count()}")
+        print(f"  Throughput: {len(tokens) / elapsed:,.0f} tokens/s")
+        print()
+        
+        if valid != len(tokens):
+            print("❌ Some tokens failed validation")
+            sys.exit(1)
+        print("✅ All tokens are valid!")
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        # Measure the validation hot path on a generated token
+        if len(sys.argv) < 3 or not sys.argv[2].isdigit() or int(sys.argv[2]) == 0:
+            print("Usage: python scripts/test-jwt-full.py --benchmark <iterations>")
+            sys.exit(1)
+        
+        iterations = int(sys.argv[2])
+        token = generate_test_token()
+        print(f"Benchmarking validation of a generated token ({iterations} iterations)...")
+        print("-" * 70)
+        ns_per_op = benchmark(token, iterations)
+        print(f"  HMAC-SHA256: {_hmac_backend()}")
+        print(f"  Verifier: {_VERIFY_BACKEND}")
+        print(f"  JSON: {'orjson' if orjson is not None else 'stdlib json'}")
+        print(f"  {ns_per_op:,.0f} ns/op")
+        print(f"  {1e9 / ns_per_op:,.0f} tokens/s")
+        print()
+    else:
+        # Validate provided token
+        if len(sys.argv) < 2:
+            print("Usage:")
+            print("  python scripts/test-jwt-full.py --generate          # Generate and test token")
+            print("  python scripts/test-jwt-full.py <token>             # Validate provided token")
+            print("  python scripts/test-jwt-full.py --batch <file>      # Validate one token per line")
+            print("  python scripts/test-jwt-full.py --benchmark <n>     # Time n validations")
+            print()
+            print("Example:")
+            print("  python scripts/test-jwt-full.py --generate")
+            print("  python scripts/test-jwt-full.py 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...'")
+            print()
+            sys.exit(1)
+        
+        _validate_and_report(sys.argv[1], 70)
+
+def main(mode='full'):
+    """Entry point: 'simple' validates a given token, 'full' also generates, batches and benchmarks"""
+    try:
+        _select_verifier(os.getenv('JWT_VERIFY_BACKEND', 'hashlib'))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    if mode == 'simple':
+        _main_simple()
+    elif mode == 'full':
+        _main_full()
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Differential test for the JWT verifier
+Runs jwt_tool's hashlib verifier and PyJWT's jwt.decode on the same crafted
+tokens and fails if they disagree on the outcome or the exception type
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import sys
+import time
+
+import jwt
+
+from jwt_tool import JWT_AUDIENCE, JWT_ISSUER, JWT_SECRET, _verify_hashlib, _verify_pyjwt
+
+# Deliberate departures from jwt.decode: case name -> what _verify_hashlib raises
+EXPECTED_DIFFERENCES = {
+    'typ other than JWT': 'InvalidTokenError',
+}
+
+def _segment(data):
+    """Encode bytes as an unpadded base64url segment"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+def _sign_raw(header, payload, key=JWT_SECRET):
+    """HS256-sign raw JSON text, bypassing PyJWT's checks on header and claims"""
+    signing_input = f"{_segment(header.encode())}.{_segment(payload.encode())}"
+    signature = hmac.new(key.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{_segment(signature)}"
+
+def _sign(claims, key=JWT_SECRET, algorithm='HS256', headers=None):
+    """Sign claims with PyJWT"""
+    return jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+def build_cases():
+    """Return (name, token) pairs covering the success and every rejection path"""
+    now = int(time.time())
+    claims = {'iss': JWT_ISSUER, 'aud': JWT_AUDIENCE, 'iat': now, 'exp': now + 3600}
+    without = lambda name: {k: v for k, v in claims.items() if k != name}
+    valid = _sign(claims)
+    header_segment, payload_segment, signature = valid.split('.')
+    unsigned_header = _segment(json.dumps({'alg': 'none'}).encode())
+
+    return [
+        ('valid', valid),
+        ('valid, audience list', _sign({**claims, 'aud': ['other', JWT_AUDIENCE]})),
+        ('valid, no typ header', _sign(claims, headers={'typ': None})),
+        ('expired', _sign({**claims, 'exp': now - 10})),
+        ('exp not a number', _sign({**claims, 'exp': 'abc'})),
+        ('nbf in the future', _sign({**claims, 'nbf': now + 1000})),
+        ('nbf not a number', _sign({**claims, 'nbf': 'abc'})),
+        ('iat in the future', _sign({**claims, 'iat': now + 1000})),
+        ('iat not a number', _sign({**claims, 'iat': 'abc'})),
+        ('expired and not yet valid', _sign({**claims, 'exp': now - 10, 'nbf': now + 1000})),
+        ('missing iss', _sign(without('iss'))),
+        ('wrong iss', _sign({**claims, 'iss': 'someone-else'})),
+        ('missing aud', _sign(without('aud'))),
+        ('empty aud', _sign({**claims, 'aud': ''})),
+        ('wrong aud', _sign({**claims, 'aud': 'someone-else'})),
+        ('aud list without match', _sign({**claims, 'aud': ['a', 'b']})),
+        ('aud list with non-string', _sign({**claims, 'aud': [1, JWT_AUDIENCE]})),
+        ('aud not a string or list', _sign({**claims, 'aud': {'x': 1}})),
+        ('wrong key', _sign(claims, key='another-secret-that-is-at-least-32-bytes')),
+        ('alg none', f"{unsigned_header}.{payload_segment}."),
+        ('alg HS384', _sign(claims, algorithm='HS384')),
+        ('alg missing', _sign_raw('{"typ": "JWT"}', json.dumps(claims))),
+        ('typ other than JWT', _sign(claims, headers={'typ': 'at+jwt'})),
+        ('header not an object', _sign_raw('["HS256"]', json.dumps(claims))),
+        ('header not JSON', _sign_raw('not json', json.dumps(claims))),
+        ('payload not an object', _sign_raw('{"alg": "HS256"}', '[1, 2]')),
+        ('payload not JSON', _sign_raw('{"alg": "HS256"}', 'not json')),
+        ('empty token', ''),
+        ('no dots', 'abc'),
+        ('two segments', f"{header_segment}.{payload_segment}"),
+        ('four segments', f"{valid}.{signature}"),
+        ('empty header', f".{payload_segment}.{signature}"),
+        ('empty payload', f"{header_segment}..{signature}"),
+        ('empty signature', f"{header_segment}.{payload_segment}."),
+        ('bad signature padding', f"{header_segment}.{payload_segment}.a"),
+        ('non-ASCII token', 'é.é.é'),
+    ]
+
+def _outcome(verify, token):
+    """'ok' or the name of the exception the verifier raised"""
+    try:
+        verify(token)
+        return 'ok'
+    except jwt.InvalidTokenError as e:
+        return type(e).__name__
+
+def main():
+    print("=" * 70)
+    print("JWT Verifier Differential Test - hashlib vs PyJWT")
+    print("=" * 70)
+    print()
+
+    failures = 0
+    for name, token in build_cases():
+        reference = _outcome(_verify_pyjwt, token)
+        expected = EXPECTED_DIFFERENCES.get(name, reference)
+        actual = _outcome(_verify_hashlib, token)
+        mark = "✅" if actual == expected else "❌"
+        failures += actual != expected
+        print(f"  {mark} {name:<30} pyjwt: {reference:<28} hashlib: {actual}")
+    print()
+
+    if failures:
+        print(f"❌ {failures} case(s) disagree with jwt.decode")
+        sys.exit(1)
+    print("✅ hashlib verifier matches jwt.decode on every case")
+
+if __name__ == '__main__':
+    main()